@@ -1,34 +1,144 @@
 from __future__ import annotations
 from pathlib import Path
+import contextlib
 import json
+import os
+import re
 from typing import Any
 
+try:  # optional fast path; stdlib json is always the fallback
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_CR_RE = re.compile(r"\r\n?")
+# Matches the stdlib output of write_json (indent=2, sorted keys, trailing newline) for
+# the plain values `_orjson_matches_stdlib` admits; everything else goes through json.
+_ORJSON_OPTS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+    if orjson is not None
+    else 0
+)
+# orjson decodes integers beyond 64 bits as rounded floats instead of raising. Such a
+# literal needs a run of 19+ digits, which a C-level translate + find spots cheaply; those
+# documents (rare, or long numeric IDs in strings) go through stdlib json.
+_DIGITS_TO_ZERO = bytes.maketrans(b"0123456789", b"0" * 10)
+_LONG_DIGIT_RUN = b"0" * 19
+_PLAIN_SCALARS = frozenset({str, int, bool, type(None)})
+_CONTAINERS = frozenset({dict, list, tuple})
+
 def _p(path: str | Path) -> Path:
     return path if isinstance(path, Path) else Path(path)
 
+def _use_orjson(encoding: str) -> bool:
+    return orjson is not None and encoding.lower().replace("-", "").replace("_", "") == "utf8"
+
+def _write_bytes(p: Path, payload: bytes, *, atomic: bool, durable: bool) -> None:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    target = p.with_suffix(p.suffix + ".tmp") if atomic else p
+    with target.open("wb") as f:
+        f.write(payload)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    if atomic:
+        target.replace(p)
+    if durable and os.name == "posix":
+        # Persist the directory entry too (the rename, or the newly created file).
+        fd = os.open(p.parent, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+def _float_matches_stdlib(v: float) -> bool:
+    # repr() switches to exponent form outside [1e-4, 1e16); orjson spells those
+    # differently and writes NaN/inf (also rejected here) as null.
+    return v == 0.0 or 1e-4 <= abs(v) < 1e16
+
+def _orjson_matches_stdlib(data: Any) -> bool:
+    """True if orjson would serialize *data* exactly like ``json.dumps``.
+
+    Non-str keys and out-of-range ints make orjson raise, so only values are checked.
+    Anything shared or circular is left to stdlib json, which reports cycles itself.
+    """
+    seen: set[int] = set()
+    stack: list[Any] = [[data]]  # only containers are ever pushed
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            return False
+        seen.add(id(obj))
+        for v in obj.values() if type(obj) is dict else obj:
+            t = type(v)
+            if t in _PLAIN_SCALARS:
+                continue
+            if t is float:
+                if not _float_matches_stdlib(v):
+                    return False
+            elif t in _CONTAINERS:
+                stack.append(v)
+            else:
+                return False
+    return True
+
 def read_text(path: str | Path, *, encoding: str = "utf-8") -> str:
     """Read a UTF-8 text file."""
     return _p(path).read_text(encoding=encoding)
 
-def write_text(path: str | Path, data: str, *, encoding: str = "utf-8", newline: str = "\n") -> None:
-    """Write text atomically (best-effort) with newline normalization."""
-    p = _p(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    tmp = p.with_suffix(p.suffix + ".tmp")
-    tmp.write_text(data.replace("\r\n", "\n").replace("\r", "\n").replace("\n", newline), encoding=encoding)
-    tmp.replace(p)
+def write_text(
+    path: str | Path,
+    data: str,
+    *,
+    encoding: str = "utf-8",
+    newline: str = "\n",
+    atomic: bool = True,
+    durable: bool = False,
+) -> None:
+    """Write text with newline normalization.
+
+    Args:
+        atomic: Write to a sibling ``.tmp`` file and rename it into place (best-effort
+            atomic). Pass False to write the target directly and save the extra
+            create + rename.
+        durable: fsync the file before it is renamed/closed, then fsync its parent
+            directory so the rename survives a crash (POSIX only; on Windows only the
+            file contents are flushed).
+    """
+    # One C-level scan folds \r\n and lone \r; only pay for a second pass if needed.
+    if "\r" in data:
+        data = _CR_RE.sub("\n", data)
+    if newline != "\n":
+        data = data.replace("\n", newline)
+    _write_bytes(_p(path), data.encode(encoding), atomic=atomic, durable=durable)
 
 def read_json(path: str | Path, *, encoding: str = "utf-8") -> Any:
     """Read JSON file with UTF-8."""
+    if _use_orjson(encoding):
+        raw = _p(path).read_bytes()
+        if raw.translate(_DIGITS_TO_ZERO).find(_LONG_DIGIT_RUN) < 0:
+            with contextlib.suppress(orjson.JSONDecodeError):  # e.g. NaN, which json accepts
+                return orjson.loads(raw)
+        return json.loads(raw.decode(encoding))
     with _p(path).open("r", encoding=encoding) as f:
         return json.load(f)
 
-def write_json(path: str | Path, data: Any, *, encoding: str = "utf-8", indent: int = 2) -> None:
-    """Write JSON file with stable formatting."""
-    p = _p(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    tmp = p.with_suffix(p.suffix + ".tmp")
-    with tmp.open("w", encoding=encoding) as f:
-        json.dump(data, f, ensure_ascii=False, indent=indent, sort_keys=True)
-        f.write("\n")
-    tmp.replace(p)
+def write_json(
+    path: str | Path,
+    data: Any,
+    *,
+    encoding: str = "utf-8",
+    indent: int = 2,
+    atomic: bool = True,
+    durable: bool = False,
+) -> None:
+    """Write JSON file with stable formatting. ``atomic``/``durable`` as in `write_text`."""
+    payload = None
+    if indent == 2 and _use_orjson(encoding) and _orjson_matches_stdlib(data):
+        # Non-str keys, out-of-range ints, lone surrogates: let stdlib json handle them.
+        with contextlib.suppress(TypeError):
+            payload = orjson.dumps(data, option=_ORJSON_OPTS)
+    if payload is None:
+        text = json.dumps(data, ensure_ascii=False, indent=indent, sort_keys=True)
+        payload = (text + "\n").encode(encoding)
+    _write_bytes(_p(path), payload, atomic=atomic, durable=durable)
@@ -1,3 +1,13 @@
+import datetime
+import json
+import math
+import os
+import pathlib
+import stat
+import uuid
+
+import pytest
+
 import rallytools as rt
 
 def test_import_and_basics():
@@ -11,3 +21,112 @@ def test_import_and_basics():
         rt.write_json(p, {"a": 1})
         data = rt.read_json(p)
         assert data["a"] == 1
+
+def test_write_text_normalizes_newlines(tmp_path):
+    p = tmp_path / "note.txt"
+    rt.write_text(p, "a\r\nb\rc\n")
+    assert p.read_bytes() == b"a\nb\nc\n"
+    rt.write_text(p, "a\r\nb\rc\n", newline="\r\n")
+    assert p.read_bytes() == b"a\r\nb\r\nc\r\n"
+
+@pytest.mark.parametrize(
+    "write, data",
+    [(rt.write_text, "hi\n"), (rt.write_json, {"a": 1})],
+)
+def test_atomic_and_durable_options(tmp_path, monkeypatch, write, data):
+    renames, fsyncs = [], []
+    real_replace, real_fsync = pathlib.Path.replace, os.fsync
+
+    def replace(self, target):
+        renames.append(self)
+        return real_replace(self, target)
+
+    def fsync(fd):
+        fsyncs.append("dir" if stat.S_ISDIR(os.fstat(fd).st_mode) else "file")
+        real_fsync(fd)
+
+    monkeypatch.setattr(pathlib.Path, "replace", replace)
+    monkeypatch.setattr(os, "fsync", fsync)
+
+    p = tmp_path / "out"
+    write(p, data, atomic=False)
+    assert renames == [] and fsyncs == []
+    write(p, data)
+    assert len(renames) == 1 and fsyncs == []
+    write(p, data, atomic=False, durable=True)
+    assert len(renames) == 1 and fsyncs[0] == "file"
+    fsyncs.clear()
+    write(p, data, durable=True)
+    assert len(renames) == 2
+    assert fsyncs == (["file", "dir"] if os.name == "posix" else ["file"])
+    assert list(tmp_path.iterdir()) == [p]
+
+def _write_both(tmp_path, monkeypatch, data):
+    """Bytes (or exception type) written by write_json with and without orjson."""
+    from rallytools import io
+
+    def written(name):
+        try:
+            rt.write_json(tmp_path / name, data)
+        except (TypeError, ValueError) as e:
+            return type(e)
+        return (tmp_path / name).read_bytes()
+
+    fast = written("fast.json")
+    with monkeypatch.context() as m:
+        m.setattr(io, "orjson", None)
+        return fast, written("std.json")
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"é": 1, "z": 2, "\U0001f600": 3, "ÿ": 4, "A": 5, "": 6},
+        {"s": "tab\t nl\n nul\x00 del\x7f quote\" bs\\ \u2028 \U0001f600"},
+        {"a": {}, "b": [], "c": [{}, [[]], {"d": {}}]},
+        {"t": (1, "x", (2.5, None))},
+        {"f": [-0.0, 0.0, 1e15, 0.0001, 1 / 3, -123.456, 9999999999999998.0]},
+        [True, False, None, -(2**63), 2**64 - 1],
+        "top-level string",
+        0.5,
+    ],
+)
+def test_write_json_orjson_output_matches_stdlib(tmp_path, monkeypatch, data):
+    pytest.importorskip("orjson")
+    from rallytools import io
+
+    assert io._orjson_matches_stdlib(data)  # the orjson path is really taken
+    fast, std = _write_both(tmp_path, monkeypatch, data)
+    assert fast == std
+    assert rt.read_json(tmp_path / "fast.json") == json.loads(std)
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"x": float("nan"), "y": float("inf"), "z": float("-inf")},
+        {"big": 123456789012345678901234567890},
+        {"e": [1e16, 1e-7, 1.5, -0.0]},
+        {10: "a", 9: "b"},
+        {1: "a", "b": 2},
+        {"u": uuid.UUID(int=1)},
+        {"t": datetime.datetime(2024, 1, 2, 3, 4, 5)},
+    ],
+)
+def test_write_json_falls_back_to_stdlib(tmp_path, monkeypatch, data):
+    pytest.importorskip("orjson")
+    fast, std = _write_both(tmp_path, monkeypatch, data)
+    assert fast == std
+
+def test_write_json_circular_raises(tmp_path):
+    a = []
+    a.append(a)
+    with pytest.raises(ValueError, match="Circular reference"):
+        rt.write_json(tmp_path / "c.json", a)
+
+def test_read_json_orjson_falls_back(tmp_path):
+    pytest.importorskip("orjson")
+    p = tmp_path / "x.json"
+    p.write_text('{"n": NaN, "big": 123456789012345678901234567890, "id": "12345678901234567890"}')
+    data = rt.read_json(p)
+    assert math.isnan(data["n"])
+    assert data["big"] == 123456789012345678901234567890
+    assert data["id"] == "12345678901234567890"